@@ -1,6 +1,8 @@
 """
 Breakwater Design with Python
 """
+from importlib import import_module as _import_module
+
 # import hydraulic conditions
 from .core.battjes import BattjesGroenendijk
 from .core.goda import goda_wave_heights
@@ -21,10 +23,22 @@ from .design import read_breakwaters
 # excel input
 from .material import read_grading, read_units
 from .design import read_configurations
-from .utils.input_generator import generate_excel
 
-# interactive design tool (tkinter app)
-from .interactive import interactive_design
+# the excel generator and the interactive design tool (tkinter app) are
+# imported on first access, so that tkinter is not loaded when the
+# package is only used from scripts
+_LAZY = {
+    'generate_excel': 'breakwater.utils.input_generator',
+    'interactive_design': 'breakwater.interactive'}
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = _import_module(_LAZY[name])
+        return getattr(module, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
 
 # import the soil
 from .core.soil import Soil
@@ -205,14 +205,14 @@ class InteractiveDesign(tk.Frame):
             output = self.controller.parameters.copy()
 
             # caisson structure, remove layers rock and units
-            if 'layers_rock' in output.keys():
+            if 'layers_rock' in output:
                 del output['layers_rock']
 
-            if 'layers_rock' in output.keys():
+            if 'layers_rock' in output:
                 del output['layers_units']
 
             if structure == 'RC':
-                if 'BermMaterial' in output.keys():
+                if 'BermMaterial' in output:
                     del output['BermMaterial']
 
             return output
@@ -347,7 +347,7 @@ class InteractiveDesign(tk.Frame):
         # iterate over the varying parameters
         for parameter, values in varying.items():
             # check if parameter is valid for the given structure
-            if parameter in vkwargs.keys():
+            if parameter in vkwargs:
                 # make slider and add slider to attribute
                 self.sliders[parameter] = make_slider(
                     parameter, values, parent, width)
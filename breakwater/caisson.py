@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from tabulate import tabulate
 
 from .utils.exceptions import InputError, user_warning, NotSupportedError, RockGradingError
@@ -149,6 +148,9 @@ class Caisson:
         # set cost Attribute
         self.price = None
 
+        # set attribute to cache the area of the layers of each variant
+        self._areas = {}
+
         # compute relative buoyant density
         delta = (BermMaterial.rho - rho_w)/rho_w
 
@@ -168,7 +170,7 @@ class Caisson:
             if Grading is None and top_layer != 'Rock':
                 # no grading for armour unit, thus raise error
                 supported_armour_units = [
-                    layer for layer in supported if layer is not 'Rock']
+                    layer for layer in supported if layer != 'Rock']
                 support_out = ', '.join(supported_armour_units)
                 raise InputError(
                     'Missing argument: Grading. The top layer is made out of '
@@ -758,6 +760,8 @@ class Caisson:
         KeyError
             If there is no variant with the given identifier
         """
+        import matplotlib.pyplot as plt
+
         # validate variants
         variants = self._validate_variant(variants)
 
@@ -880,6 +884,16 @@ class Caisson:
         dict
             dict with the area of each layer
         """
+        # the geometry of a variant is fixed once it has been designed,
+        # so the areas are computed once and reused, for instance when
+        # both the material and the CO2 cost are computed
+        computed = getattr(self, '_areas', None)
+        if computed is None:
+            # concept was saved before the areas were cached
+            computed = self._areas = {}
+        if variantID in computed:
+            return dict(computed[variantID])
+
         # get the coordinates of the layers
         coordinates = self._layers(variantID)
 
@@ -896,7 +910,9 @@ class Caisson:
             # add to area dict
             area[layer] = A
 
-        return area
+        computed[variantID] = area
+
+        return dict(area)
 
     def cost(
             self, *variants, concrete_price, fill_price, unit_price=None,
@@ -940,13 +956,16 @@ class Caisson:
         # get the grading, and check if the cost has been added
         Grading = self._input_arguments['Grading']
 
-        if 'price' in Grading[list(Grading.grading.keys())[0]]:
+        if 'price' in Grading[next(iter(Grading.grading))]:
             # pricing has been added
             pass
         else:
             # pricing has not been added, raise error
             raise RockGradingError('There is no pricing in the RockGrading')
 
+        # the type of armour is the same for all variants
+        concrete_armour = self._input_arguments['armour'] != 'Rock'
+
         # set empty dict to store the output in
         cost = {}
 
@@ -959,12 +978,11 @@ class Caisson:
             # iterate over the layers to price each layer
             variant_price = {}
             for layer, area in areas.items():
-                if layer is 'caisson':
+                if layer == 'caisson':
                     # compute price of the caisson
                     Pc = structure['caisson']['Pc']
                     price = area*Pc*concrete_price + area*(1-Pc)*fill_price
-                elif (self._input_arguments['armour'] is not 'Rock'
-                        and layer is 'armour'):
+                elif concrete_armour and layer == 'armour':
                     # concrete armour units
                     if unit_price is not None:
                         price = area * unit_price
@@ -983,10 +1001,10 @@ class Caisson:
                 variant_price[layer] = np.round(price, 2)
 
             # add to cost dict
-            if output is 'variant' or output is 'average':
+            if output == 'variant' or output == 'average':
                 # add total cost of all layers
                 cost[id] = np.round(np.sum(list(variant_price.values())), 2)
-            elif output is 'layer':
+            elif output == 'layer':
                 # add the cost of each layer
                 cost[id] = variant_price
             else:
@@ -996,7 +1014,7 @@ class Caisson:
                       'layer or average'))
 
         # check if average must be computed
-        if output is 'average':
+        if output == 'average':
             # compute average cost
             cost = {'average': np.round(np.average(list(cost.values())), 2)}
 
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from scipy.optimize import fsolve
 
 from .utils.exceptions import InputError, limitstate_warning
@@ -361,7 +360,7 @@ class LimitState:
 
         if deep_water:
             # user wants deep water wave length
-            wave_length = 9.81*T**2/(2*np.pi)
+            wave_length = 9.81/(2*np.pi) * T*T
         else:
             # user wants to use the dispersion relation
             wave_length = dispersion(T=T, h=self.h)
@@ -458,10 +457,10 @@ class LimitState:
         """
         if H is None and T is None:
             s = self.s(number=number)
-            xi = np.tan(alpha)/np.sqrt(s)
         else:
             s = self.s(H=H, T=T)
-            xi = np.tan(alpha)/np.sqrt(s)
+
+        xi = np.tan(alpha)/np.sqrt(s)
 
         return xi
 
@@ -1,7 +1,6 @@
 import numpy as np
 import scipy.special as sc
 from scipy.optimize import fsolve
-import matplotlib.pyplot as plt
 
 
 class BattjesGroenendijk:
@@ -1,5 +1,5 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from math import asin, sqrt
 
 from ..utils.exceptions import user_warning, InputError
 
@@ -177,7 +177,7 @@ class Bishop:
         phi = phi*np.pi/180
 
         # check if name is already in
-        if name in self.layers.keys():
+        if name in self.layers:
             # show warning that layer is overwritten
             user_warning(
                 (f'{name} already a layer, layer has been overwritten by the'
@@ -256,30 +256,39 @@ class Bishop:
                     num_slices=num_slices, point2=(self.x2, self.y2),
                     layers=self.layers)
 
+            # the load and the terms of the strength that do not depend
+            # on F are computed once for all slices of the circle, so
+            # that each iteration is a single array expression
+            load = 0
+            terms = []
+
+            # iterate over the slices
+            for slice, coords in SlipCircle.slices.items():
+                # check slice number
+                if slice == 0:
+                    # only include pressure for the first slice
+                    pressure = True
+                else:
+                    # other slides no pressure, otherwise doubling
+                    pressure = False
+
+                # compute load and the terms of the strength
+                load += self._load(coords['alpha_s'], coords['h'])
+                terms.append(self._strength_terms(
+                    alpha_s=coords['alpha_s'], heights=coords['h'],
+                    pressure=pressure, gamma_w=gamma_w))
+
+            # unpack the terms of the strength into arrays
+            A, B, C = np.array(terms).T
+
             # set first estimate for F and iteration tracker
             F = 1
             i = 0
 
             # iteratively compute the factor of safety
             while True:
-                # set strength and load variable
-                strength, load = 0, 0
-
-                # iterate over the slices
-                for slice, coords in SlipCircle.slices.items():
-                    # check slice number
-                    if slice == 0:
-                        # only include pressure for the first slice
-                        pressure = True
-                    else:
-                        # other slides no pressure, otherwise doubling
-                        pressure = False
-
-                    # compute load and strength
-                    load += self._load(coords['alpha_s'], coords['h'])
-                    strength += self._strength(
-                        alpha_s=coords['alpha_s'], heights=coords['h'], F=F,
-                        pressure=pressure, gamma_w=gamma_w)
+                # compute the strength of all slices
+                strength = np.sum(A/(C*(1 + B/F)))
 
                 # # compute factor of safety
                 F_new = strength/load
@@ -328,21 +337,24 @@ class Bishop:
 
         # iterate over the layers
         for layer, h in heights.items():
+            # get the top and bottom of the layer in the slice
+            htop, hbottom = max(h), min(h)
+
             # check if there is a wlev
             if self.wlev is not None:
                 # check if layer is above or below the wlev
-                if self.wlev >= np.max(h):
+                if self.wlev >= htop:
                     # entire layer is below the water level
-                    W += self.layers[layer]['gamma_sat']*(np.max(h)-np.min(h))
+                    W += self.layers[layer]['gamma_sat']*(htop-hbottom)
 
-                elif np.min(h) >= self.wlev:
+                elif hbottom >= self.wlev:
                     # entire layer is above the wlev
-                    W += self.layers[layer]['gamma']*(np.max(h)-np.min(h))
+                    W += self.layers[layer]['gamma']*(htop-hbottom)
 
                 else:
                     # layer is partly in the water, compute wet and dry h
-                    h_dry = np.max(h) - self.wlev
-                    h_wet = (np.max(h)-np.min(h)) - h_dry
+                    h_dry = htop - self.wlev
+                    h_wet = (htop-hbottom) - h_dry
 
                     # compute weight of the layer
                     W += (self.layers[layer]['gamma_sat']*h_wet
@@ -350,7 +362,7 @@ class Bishop:
 
             else:
                 # not wlev specified, compute the load
-                W += self.layers[layer]['gamma']*(np.max(h)-np.min(h))
+                W += self.layers[layer]['gamma']*(htop-hbottom)
 
         return W*np.sin(alpha_s)
 
@@ -383,6 +395,42 @@ class Bishop:
         float
             strength of the slice
         """
+        A, B, C = self._strength_terms(
+            alpha_s=alpha_s, heights=heights, pressure=pressure,
+            gamma_w=gamma_w)
+
+        return A/(C*(1 + B/F))
+
+    def _strength_terms(self, alpha_s, heights, pressure, gamma_w=None):
+        """ Compute the terms of the strength of a slice
+
+        Method computes the terms of the strength of a slice that do not
+        depend on the factor of safety, the strength is given by:
+
+        .. math::
+           \\text{strength} = \\frac{A}{C (1 + B / F)}
+
+        with :math:`A = c+(\\gamma h-p) \\tan \\phi`,
+        :math:`B = \\tan \\alpha \\tan \\phi` and
+        :math:`C = \\cos \\alpha`.
+
+        Parameters
+        ----------
+        alpha_s : float
+            slip angle of the slice [rad]
+        heights : dict
+            dictionary with the height of each layer
+        pressure : bool
+            True if the pressure must be included in the computation,
+            False if not
+        gamma_w : float, optional, default: None
+            volumetric weight of water [kN/m³]
+
+        Returns
+        -------
+        tuple
+            the terms A, B and C of the strength of the slice
+        """
         # set variable for adding weights
         W = 0
 
@@ -395,8 +443,8 @@ class Bishop:
                     'gamma_w must be specified when computing with a wlev')
 
             # get top and bottom coordinate of the slice
-            ytop = np.max(list(heights.values()))
-            ybottom = np.min(list(heights.values()))
+            ytop = max(max(h) for h in heights.values())
+            ybottom = min(min(h) for h in heights.values())
 
             # check if top is above the wlev
             if ytop >= self.wlev:
@@ -413,6 +461,9 @@ class Bishop:
 
         # iterate over the layers
         for i, (layer, h) in enumerate(heights.items()):
+            # get the top and bottom of the layer in the slice
+            htop, hbottom = max(h), min(h)
+
             # check if first layer
             if i == 0:
                 # first layer of the slice offers the resistance
@@ -422,18 +473,18 @@ class Bishop:
             # check if there is a wlev
             if self.wlev is not None:
                 # check if layer is above or below the wlev
-                if self.wlev >= np.max(h):
+                if self.wlev >= htop:
                     # entire layer is below the water level
-                    W += self.layers[layer]['gamma_sat']*(np.max(h)-np.min(h))
+                    W += self.layers[layer]['gamma_sat']*(htop-hbottom)
 
-                elif np.min(h) >= self.wlev:
+                elif hbottom >= self.wlev:
                     # entire layer is above the wlev
-                    W += self.layers[layer]['gamma']*(np.max(h)-np.min(h))
+                    W += self.layers[layer]['gamma']*(htop-hbottom)
 
                 else:
                     # layer is partly in the water, compute wet and dry h
-                    h_dry = np.max(h) - self.wlev
-                    h_wet = (np.max(h)-np.min(h)) - h_dry
+                    h_dry = htop - self.wlev
+                    h_wet = (htop-hbottom) - h_dry
 
                     # compute weight of the layer
                     W += (self.layers[layer]['gamma_sat']*h_wet
@@ -441,15 +492,14 @@ class Bishop:
 
             else:
                 # not wlev specified, compute the weight of the layer
-                W += params['gamma']*(np.max(h)-np.min(h))
+                W += params['gamma']*(htop-hbottom)
 
-        # compute the strength
+        # compute the terms of the strength
         A = params['c'] + (W - p)*np.tan(params['phi'])
-        B = np.tan(alpha_s)*np.tan(params['phi'])/F
-        C = np.cos(alpha_s)*(1 + B)
-        strength = A/C
+        B = np.tan(alpha_s)*np.tan(params['phi'])
+        C = np.cos(alpha_s)
 
-        return strength
+        return A, B, C
 
     def plot(self, id=None, show_slices=False):
         """ Plot slip circle(s)
@@ -467,6 +517,8 @@ class Bishop:
             computation. The default value is False, meaning that the
             slices will not be plotted.
         """
+        import matplotlib.pyplot as plt
+
         # create figure
         fig, ax = plt.subplots()
 
@@ -645,7 +697,7 @@ class SlipCircle:
         elif len(layers) == 1:
             # only one layer defined
             # get name of the layer
-            name = list(layers.keys())[0]
+            name = next(iter(layers))
 
             # add to dict
             height[name] = (ym_top, ym_low)
@@ -686,12 +738,9 @@ class SlipCircle:
 
         # check value of D
         if D > 0:
-            # two solutions possible, compute y coordinates
-            y1 = (-b + np.sqrt(b**2 - 4*a*c))/(2*a)
-            y2 = (-b - np.sqrt(b**2 - 4*a*c))/(2*a)
-
-            # return lowest value
-            return np.min([y1, y2])
+            # two solutions possible, a is positive so the lowest
+            # solution is the one with the negative square root
+            return (-b - sqrt(D))/(2*a)
 
         elif D == 0 or D > -0.1**10:
             # one solutions
@@ -734,10 +783,10 @@ class SlipCircle:
         else:
             # compute chord from the line vertical from the middle of
             # the slice to the middle of the slice
-            chord = np.sqrt((xm-self.xy[0])**2 + (ym-yc_inter)**2)
+            chord = sqrt((xm-self.xy[0])**2 + (ym-yc_inter)**2)
 
             # compute slip angle of the middle of the slice
-            alpha_s = 2*np.arcsin(0.5*chord/self.r)
+            alpha_s = 2*asin(0.5*chord/self.r)
 
             # check if right or left from the centre of the circle
             if xm < self.xy[0]:
@@ -749,6 +798,8 @@ class SlipCircle:
 
     def _make_figure(self, ax, show_slices):
         """ Method to generate a figure of the circle """
+        import matplotlib.pyplot as plt
+
         # plot circle
         circle1 = plt.Circle(
             self.xy, self.r, color='darkgrey', ls='--', fill=False)
@@ -865,6 +916,8 @@ class SlipCircle:
             computation. The default value is False, meaning that the
             slices will not be plotted.
         """
+        import matplotlib.pyplot as plt
+
         # set additional spacing
         spacing = self.r/5
         # create figure
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from scipy.optimize import fsolve
 
 from ..utils.exceptions import InputError, user_warning
@@ -53,26 +52,29 @@ def goda_wave_heights(h, d, Ho, T, slope_foreshore, Ks=None, factor=1.8):
         H13 = Ks*Ho
         Hmax = factor*Ks*Ho
     else:
-        beta_0 = (0.028*(Ho/L_o)**-0.38
-                       * np.exp(20*np.tan(slope_foreshore)**1.5))
-        beta_1 = 0.52 * np.exp(4.2*np.tan(slope_foreshore))
-        beta_max = max([0.92, (0.32*(Ho/L_o)**-0.29
-                               * np.exp(2.4*np.tan(slope_foreshore)))])
+        # terms used by both the coefficients of H1/3 and Hmax
+        tan_slope = np.tan(slope_foreshore)
+        steepness_0 = (Ho/L_o)**-0.38
+        steepness_max = (Ho/L_o)**-0.29
+        slope_0 = np.exp(20*tan_slope**1.5)
+        slope_max = np.exp(2.4*tan_slope)
 
-        beta_0_star = (0.052*(Ho/L_o)**-0.38
-                       * np.exp(20*np.tan(slope_foreshore)**1.5))
-        beta_1_star = 0.63 * np.exp(3.8*np.tan(slope_foreshore))
-        beta_max_star = max([1.65, (0.53*(Ho/L_o)**-0.29
-                                    * np.exp(2.4*np.tan(slope_foreshore)))])
+        beta_0 = 0.028*steepness_0 * slope_0
+        beta_1 = 0.52 * np.exp(4.2*tan_slope)
+        beta_max = max(0.92, 0.32*steepness_max * slope_max)
 
-        H13 = min([beta_0*Ho + beta_1*h, beta_max*Ho, Ks*Ho])
+        beta_0_star = 0.052*steepness_0 * slope_0
+        beta_1_star = 0.63 * np.exp(3.8*tan_slope)
+        beta_max_star = max(1.65, 0.53*steepness_max * slope_max)
+
+        H13 = min(beta_0*Ho + beta_1*h, beta_max*Ho, Ks*Ho)
 
         # water depth at a location of 5x H1/3
-        hb = h + 5 * np.tan(slope_foreshore) * H13
+        hb = h + 5 * tan_slope * H13
 
-        Hmax = min([beta_0_star*Ho + beta_1_star*hb,
-                    beta_max_star*Ho,
-                    factor*Ks*Ho])
+        Hmax = min(beta_0_star*Ho + beta_1_star*hb,
+                   beta_max_star*Ho,
+                   factor*Ks*Ho)
     return H13, Hmax
 
 class Goda:
@@ -164,8 +166,8 @@ class Goda:
         # compute wave pressure coefficients (Goda, 2000)
         alpha_1 = (0.6 + 0.5*((4*np.pi*self._h/self.L)
                                / np.sinh(4*np.pi*self._h/self.L))**2)
-        alpha_2 = min([(self.hb-self._d)/(3*self.hb)*(Hmax/self._d)**2,
-                        2*self._d/Hmax])
+        alpha_2 = min((self.hb-self._d)/(3*self.hb)*(Hmax/self._d)**2,
+                      2*self._d/Hmax)
         alpha_3 = 1 - self._h_acc/self._h * (1-1/np.cosh(2*np.pi*self._h/self.L))
 
         # check for impulsive pressures and adjust alpha_2 if needed
@@ -199,7 +201,7 @@ class Goda:
                    * lambda_[2]*alpha_1*alpha_3*self.rho*9.81*Hmax)
 
         # Determine h_c_star
-        self.h_c_star = min([self.eta_star, self._hc])
+        self.h_c_star = min(self.eta_star, self._hc)
 
     @property
     def _width(self):
@@ -647,6 +649,8 @@ class Goda:
            the axes of the figure. The correct dimensions of the
            monolithic breakwater can be read from the figure.
         """
+        import matplotlib.pyplot as plt
+
         # get the width
         B = self._width
 
@@ -2,6 +2,28 @@ import numpy as np
 
 from ..utils.exceptions import user_warning, NotSupportedError
 
+# influence factor for roughness from table 6.2 of EurOtop (2018), the
+# table is constant so it is defined once instead of in every call
+_ROUGHNESS_FACTORS = {
+    'Smooth': 1,
+    'Rock - 1 - permeable': 0.6,
+    'Rock - 1 - impermeable': 0.45,
+    'Rock - 2 - permeable': 0.55,
+    'Rock - 2 - impermeable': 0.40,
+    'Cubes - 1 - flat': 0.49,
+    'Cubes - 2 - random': 0.47,
+    'Antifers': 0.5,
+    'HARO': 0.47,
+    'Tetrapods': 0.38,
+    'Dolos': 0.43,
+    'Accropode I': 0.46,
+    'Xbloc': 0.44,
+    'XblocPlus': 0.45,
+    'CoreLoc': 0.44,
+    'Accropode II': 0.44,
+    'Cubipods - 1': 0.49,
+    'Cubipods - 2': 0.47}
+
 def gamma_f(
         armour_layer, xi_m_min_1, layers=None, permeability=None,
         placement=None):
@@ -78,24 +100,7 @@ def gamma_f(
     Keyerror
         If the armour layer is not in table 6.2 from EurOtop (2018)
     """
-    table = {'Smooth': 1,
-             'Rock - 1 - permeable': 0.6,
-             'Rock - 1 - impermeable': 0.45,
-             'Rock - 2 - permeable': 0.55,
-             'Rock - 2 - impermeable': 0.40,
-             'Cubes - 1 - flat': 0.49,
-             'Cubes - 2 - random': 0.47,
-             'Antifers': 0.5,
-             'HARO': 0.47,
-             'Tetrapods': 0.38,
-             'Dolos': 0.43,
-             'Accropode I': 0.46,
-             'Xbloc': 0.44,
-             'XblocPlus': 0.45,
-             'CoreLoc': 0.44,
-             'Accropode II': 0.44,
-             'Cubipods - 1': 0.49,
-             'Cubipods - 2': 0.47}
+    table = _ROUGHNESS_FACTORS
     if armour_layer == 'Smooth':
         key = 'Smooth'
     elif armour_layer == 'Rock':
@@ -108,7 +113,7 @@ def gamma_f(
         key = f'{armour_layer}'
 
     # check if the armour layer (key) is in the table
-    if key in table.keys():
+    if key in table:
         # get the gamma_f value
         gamma_f = table[key]
     else:
@@ -256,7 +261,7 @@ def rubble_mound(
         user_warning(msg)
 
     # in case of a wide crest the overtopping in the equation can be increased
-    if Gc != None and Gc > 3*Dn50:
+    if Gc is not None and Gc > 3*Dn50:
         Cr = 3.06 * np.exp(-1.5*Gc/Hm0)
         q = q / min(Cr, 1)
 
@@ -732,7 +737,7 @@ def vertical(
             else:
                 Rc = vertical_no_breaking(Hm0, q, safety, limit)
                 log = 'overtopping for composite with no breaking waves'
-    if logger != None:
+    if logger is not None:
         logger['INFO'].append(log)
 
     return Rc
@@ -7,28 +7,48 @@ def xi_critical(Cpl, Cs, P, alpha):
 
     The critical value of the surf-similarity parameter is used in the
     Van der Meer formulas to determine the transition from plunging to
-    surging waves.
+    surging waves. It follows from equating the formulae for plunging
+    and surging waves, which gives the closed form:
+
+    .. math::
+       \\xi_{cr} = \\left(\\frac{c_{pl}}{c_{s}} P^{0.31}
+       \\sqrt{\\tan \\alpha}\\right)^{\\frac{1}{P+0.5}}
 
     Parameters
     ----------
-    P : float
+    P : float or array_like
         Notional permeability of the structure [-]
-    Cpl : float
+    Cpl : float or array_like
         Model constant for plunging waves [-]
-    Cs : float
+    Cs : float or array_like
         Model constant for surging waves [-]
-    alpha : float
+    alpha : float or array_like
         Slope of the structure [rad]
 
     Returns
     -------
-    float
+    float or ndarray
         The critical value of the surf-similarity parameter [-]
     """
-    xi_cr = (Cpl/Cs * P**0.31 * np.sqrt(np.tan(alpha)))**(1/(P+0.5))
+    return _xi_critical(Cpl, Cs, P, np.tan(alpha))
+
+
+def _xi_critical(Cpl, Cs, P, tan_alpha):
+    """ xi_critical for a precomputed tangent of the slope """
+    xi_cr = (Cpl/Cs * P**0.31 * np.sqrt(tan_alpha))**(1/(P+0.5))
     return xi_cr
 
 
+def _plunging(Cpl, P, damage, xi):
+    """ Stability number of the Van der Meer formula for plunging waves """
+    return Cpl*P**0.18*damage*xi**-0.5
+
+
+def _surging(Cs, P, damage, tan_alpha, xi):
+    """ Stability number of the Van der Meer formula for surging waves """
+    return Cs*P**-0.13*damage*np.sqrt(1/tan_alpha)*xi**P
+
+
 def vandermeer_deep(Hs, Delta, P, Sd, N, xi_m, alpha, safety=1):
     """ Van der Meer formulae for deep water conditions
 
@@ -84,21 +104,21 @@ def vandermeer_deep(Hs, Delta, P, Sd, N, xi_m, alpha, safety=1):
 
     Parameters
     ----------
-    Hs : float
+    Hs : float or array_like
         The significant wave height, :math:`H_{1/3}` of the incident
         waves at the toe [m]
-    Delta : float
+    Delta : float or array_like
         Relative buoyant density [-]
-    P : float
+    P : float or array_like
         Notional permeability of the structure [-]
-    Sd : float
+    Sd : float or array_like
         Damage level parameter [-]
-    N : int
+    N : int or array_like
         Number of incident waves at the toe of the structure [-]
-    xi_m : float
+    xi_m : float or array_like
         :math:`\\xi_m`, the surf-similarity parameter computed with
         the mean wave period :math:`T_m` [-]
-    alpha : float
+    alpha : float or array_like
         Angle of the front slope [rad]
     safety : float, optional, default: 1
         With this parameter the model constants, Cpl and Cs, can be
@@ -107,21 +127,32 @@ def vandermeer_deep(Hs, Delta, P, Sd, N, xi_m, alpha, safety=1):
 
     Returns
     -------
-    Dn50 : float
+    Dn50 : float or ndarray
         the nominal diameter of the armourstone [m]
     """
     Cpl = 6.2 - safety*0.4
     Cs = 1 - safety*0.08
 
-    xi_cr = xi_critical(Cpl, Cs, P, alpha)
+    # tan of the slope is shared by xi_critical and the surging formula
+    tan_alpha = np.tan(alpha)
+    xi_cr = _xi_critical(Cpl, Cs, P, tan_alpha)
+    damage = (Sd/np.sqrt(N))**0.2
+
+    plunging = xi_m < xi_cr
+
+    if np.ndim(plunging) == 0:
+        # scalar input, only evaluate the governing branch
+        if plunging:
+            Dn50 = Hs/(Delta*_plunging(Cpl, P, damage, xi_m))
+        else:
+            Dn50 = Hs/(Delta*_surging(Cs, P, damage, tan_alpha, xi_m))
+    else:
+        # array input, compute both branches and select the plunging
+        # or surging branch elementwise, scalar inputs are not broadcast
+        Dn50 = Hs/(Delta*np.where(
+            plunging, _plunging(Cpl, P, damage, xi_m),
+            _surging(Cs, P, damage, tan_alpha, xi_m)))
 
-    if xi_m < xi_cr:  # Plunging waves
-        Dn50 = Hs/(Delta*Cpl*P**0.18
-                   * (Sd/np.sqrt(N))**0.2*xi_m**-0.5)
-    else:  # Surging waves
-        Dn50 = Hs/(Delta*Cs*P**-0.13
-                   * (Sd/np.sqrt(N))**0.2*np.sqrt(1/np.tan(alpha))
-                   * xi_m**P)
     return Dn50
 
 
@@ -180,24 +211,24 @@ def vandermeer_shallow(Hs, H2, Delta, P, Sd, N, xi_s_min_1, alpha, safety=1):
 
     Parameters
     ----------
-    Hs : float
+    Hs : float or array_like
         The significant wave height, :math:`H_{1/3}` of the incident
         waves at the toe [m]
-    H2 : float
+    H2 : float or array_like
         :math:`H_{2\\%}`, wave height exceeded by 2% of the incident
         waves at the toe [m]
-    Delta : float
+    Delta : float or array_like
         Relative buoyant density [-]
-    P : float
+    P : float or array_like
         Notional permeability of the structure [-]
-    Sd : float
+    Sd : float or array_like
         Damage level parameter [-]
-    N : int
+    N : int or array_like
         Number of incident waves at the toe of the structure [-]
-    xi_m_min_1 : float
+    xi_m_min_1 : float or array_like
         :math:`\\xi_{s-1.0}`, the surf-similarity parameter computed
         with the energy wave period :math:`T_{m-1.0}` [-]
-    alpha : float
+    alpha : float or array_like
         Angle of the front slope [rad]
     safety : float, optional, default: 1
         With this parameter the model constants, Cpl and Cs, can be
@@ -206,21 +237,32 @@ def vandermeer_shallow(Hs, H2, Delta, P, Sd, N, xi_s_min_1, alpha, safety=1):
 
     Returns
     -------
-    Dn50 : float
+    Dn50 : float or ndarray
         the nominal diameter of the armourstone [m]
     """
     Cpl = 8.4 - safety*0.7
     Cs = 1.3 - safety*0.15
 
-    xi_cr = xi_critical(Cpl, Cs, P, alpha)
+    # tan of the slope is shared by xi_critical and the surging formula
+    tan_alpha = np.tan(alpha)
+    xi_cr = _xi_critical(Cpl, Cs, P, tan_alpha)
+    damage = (Sd/np.sqrt(N))**0.2 * (Hs/H2)
+
+    plunging = xi_s_min_1 < xi_cr
+
+    if np.ndim(plunging) == 0:
+        # scalar input, only evaluate the governing branch
+        if plunging:
+            Dn50 = Hs/(Delta*_plunging(Cpl, P, damage, xi_s_min_1))
+        else:
+            Dn50 = Hs/(1.6*_surging(Cs, P, damage, tan_alpha, xi_s_min_1))
+    else:
+        # array input, compute both branches and select the plunging
+        # or surging branch elementwise, scalar inputs are not broadcast
+        Dn50 = Hs/np.where(
+            plunging, Delta*_plunging(Cpl, P, damage, xi_s_min_1),
+            1.6*_surging(Cs, P, damage, tan_alpha, xi_s_min_1))
 
-    if xi_s_min_1 < xi_cr: # Plunging waves
-        Dn50 = Hs/(Delta*Cpl* P**0.18
-                   * (Sd/np.sqrt(N))**0.2 * (Hs/H2) * xi_s_min_1**-0.5)
-    else: # Surging waves
-        Dn50 = Hs/(1.6*Cs*P**-0.13*(Sd/np.sqrt(N))**0.2
-                   * (Hs/H2) * np.sqrt(1/np.tan(alpha))
-                   * xi_s_min_1**P)
     return Dn50
 
 
@@ -337,7 +379,7 @@ def vandermeer(
         msg = f'in range of vandermeer_shallow with {LimitState.label}'
 
     # add msg to log which formula was used
-    if logger != None:
+    if logger is not None:
         logger['INFO'].append(msg)
 
     return Dn50
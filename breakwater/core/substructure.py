@@ -1,5 +1,20 @@
 from ..utils.exceptions import user_warning, InputError, NotSupportedError
 
+# layer thickness coefficients used in layer_coefficient, the tables are
+# constant so they are defined once instead of in every call
+_KT_ROCK = {
+    1: {'dense': 0.84},
+    2: {'standard': 0.91, 'dense': 0.91}}
+
+_KT_UNITS = {
+    'Cubes': {'kt': 1.1, 'layers': 2},
+    'Tetrapods': {'kt': 1.02, 'layers': 2},
+    'Dolos': {'kt': 0.94, 'layers': 2},
+    'Accropode': {'kt': 1.29, 'layers': 1},
+    'CoreLoc': {'kt': 1.52, 'layers': 1},
+    'Xbloc': {'kt': 1.4, 'layers': 1},
+    'XblocPlus': {'kt': 1.33, 'layers': 1}}
+
 # supported armour layers, i.e. for these armour layers the rules for
 # the underlayer and filter have been implemented
 def _supported_armour_layers():
@@ -149,33 +164,10 @@ def layer_coefficient(material, layers=None, placement=None):
     kt : float
         the layer thickness coefficient
     """
-    # define dict for rock
-    rock = {
-
-        1: {'dense': 0.84},
-
-        2: {'standard': 0.91, 'dense': 0.91}
-
-    }
-
-    # define dict for armour units
-    units = {
-
-        'Cubes': {'kt': 1.1, 'layers': 2},
-
-        'Tetrapods': {'kt': 1.02, 'layers': 2},
-
-        'Dolos': {'kt': 0.94, 'layers': 2},
-
-        'Accropode': {'kt': 1.29, 'layers': 1},
-
-        'CoreLoc': {'kt': 1.52, 'layers': 1},
-
-        'Xbloc': {'kt': 1.4, 'layers': 1},
-
-        'XblocPlus': {'kt': 1.33, 'layers': 1}
+    # get the constant tables for rock and armour units
+    rock = _KT_ROCK
+    units = _KT_UNITS
 
-    }
     # Check if material has Accropode in the name,
     # as it can be Accropode I or Accropode II
     if 'Accropode' in material:
@@ -183,7 +175,7 @@ def layer_coefficient(material, layers=None, placement=None):
         material = 'Accropode'
 
     # get the kt value
-    if material is 'Rock':
+    if material == 'Rock':
         # check if layer is given
         if layers is None:
             raise InputError(
@@ -197,7 +189,7 @@ def layer_coefficient(material, layers=None, placement=None):
         # get the kt value
         kt = rock[layers][placement.lower()]
 
-    elif material in list(units.keys()):
+    elif material in units:
         # get kt value
         kt = units[material]['kt']
 
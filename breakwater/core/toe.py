@@ -106,14 +106,15 @@ def toe_berm_stability(Hs, T, d, Bm, Delta, beta=0, alpha_s=0.45):
     L = dispersion(T=T, h=d)
     kh = 2*np.pi*d/L
 
-    kappa2 = max([alpha_s*np.sin(beta)**2 * np.cos(2*np.pi*Bm*np.cos(beta)/L)**2,
-                  np.cos(beta)**2 * np.sin(2*np.pi*Bm*np.cos(beta)/L)**2])
+    phase = 2*np.pi*Bm*np.cos(beta)/L
+    kappa2 = max(alpha_s*np.sin(beta)**2 * np.cos(phase)**2,
+                 np.cos(beta)**2 * np.sin(phase)**2)
 
     kappa = 2*kh/(np.sinh(2*kh)) * kappa2
 
     a = (1-kappa)/kappa**(1/3)
     Ns = (1.3 * a * d/Hs + 1.8 * np.exp(-1.5*d*a*(1-kappa)/Hs))
-    Ns = max([1.8, Ns])
+    Ns = max(1.8, Ns)
 
     Dn50 = Hs/(Delta*Ns)
 
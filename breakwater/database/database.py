@@ -2,8 +2,6 @@ import os
 import pandas as pd
 import numpy as np
 import scipy.stats as stats
-import matplotlib.pyplot as plt
-from matplotlib.gridspec import GridSpec
 
 from ..utils.exceptions import user_warning
 
@@ -454,6 +452,8 @@ class BreakwaterDatabase:
         ValueError
             If data required to plot a cross section is missing
         """
+        import matplotlib.pyplot as plt
+
         # set custom slope if not specified for protecting _validate
         if slope is None:
             slope = (0,0)
@@ -585,6 +585,8 @@ class BreakwaterDatabase:
         exclude : list, optional, default: None
             list of breakwater types to exclude from the plot
         """
+        import matplotlib.pyplot as plt
+
         # validate exclude input for type
         self._validate_excludes(exclude)
 
@@ -676,6 +678,9 @@ class BreakwaterDatabase:
         bins_param2 : str
             number of bins for param2
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.gridspec import GridSpec
+
         # validate exclude input for type
         self._validate_excludes(exclude)
 
@@ -806,6 +811,8 @@ class BreakwaterDatabase:
         bins : int, optional, default: 10
             number of bins
         """
+        import matplotlib.pyplot as plt
+
         # validate exclude input for type
         self._validate_excludes(exclude)
 
@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import os
@@ -668,8 +667,10 @@ class Configurations:
                 (f'{structure} has not been implemented, supported structures'
                   ' are \'RRM\', \'CRM\', \'RC\' and \'CC\''))
 
-        # initialize a df for to store the _get_concept_set
-        self.df = pd.DataFrame()
+        # initialize a list to store the df of each concept, the dfs are
+        # concatenated once all concepts are designed, appending to
+        # self.df in every iteration copies the entire df each time
+        concept_dfs = []
 
         # design all concepts for a rubble mound breakwater
         # get all possible combinations of the varying arguments
@@ -735,7 +736,7 @@ class Configurations:
                                              'slope': [slope],
                                              'slope_toe': [slope_toe],
                                              'warnings': [w]})
-                self.df = self.df.append(temp_df, ignore_index=True, sort=True)
+                concept_dfs.append(temp_df)
 
                 RM_bar.next()
 
@@ -765,7 +766,7 @@ class Configurations:
                                              'slope': [slope],
                                              'slope_toe': [slope_toe],
                                              'warnings': [w]})
-                self.df = self.df.append(temp_df, ignore_index=True, sort=True)
+                concept_dfs.append(temp_df)
 
                 RM_bar.next()
 
@@ -795,7 +796,7 @@ class Configurations:
                                              'slope': [slope],
                                              'slope_toe': [slope_toe],
                                              'warnings': [w]})
-                self.df = self.df.append(temp_df, ignore_index=True, sort=True)
+                concept_dfs.append(temp_df)
 
                 RM_bar.next()
             if id == RM_num_combinations:
@@ -871,7 +872,7 @@ class Configurations:
                                              'hb': [hb],
                                              'slope_foundation': [slope_foundation],
                                              'warnings': [w]})
-                self.df = self.df.append(temp_df, ignore_index=True, sort=True)
+                concept_dfs.append(temp_df)
 
                 C_bar.next()
 
@@ -902,13 +903,19 @@ class Configurations:
                                              'Bm': [Bm],
                                              'hb': [hb],
                                              'warnings': [w]})
-                self.df = self.df.append(temp_df, ignore_index=True, sort=True)
+                concept_dfs.append(temp_df)
 
                 C_bar.next()
 
             if id == C_num_combinations:
                 C_bar.finish()
 
+        # make a df with all designed concepts
+        if concept_dfs:
+            self.df = pd.concat(concept_dfs, ignore_index=True, sort=True)
+        else:
+            self.df = pd.DataFrame()
+
     @staticmethod
     def _get_concept_set(configs, id):
         """ get unique set of parameters and values """
@@ -1099,7 +1106,6 @@ class Configurations:
                         output='variant')
 
                 elif row.type == 'CRMR':
-                    print(row.concept.get_class())
                     price = row.concept.cost(
                         *row.concept.variantIDs, type = type, core_price=core_price,
                         unit_price=unit_price, transport_cost=transport_cost,
@@ -1583,17 +1589,12 @@ class Configurations:
                         # varying parameter, add to lines dict
                         lines[parameter] = {'values': [], cost_var: []}
 
-                        # get list of the values
-                        values = list(df[parameter].values)
-
-                        # iterate over the unique values
-                        for unique_val in unique:
-                            # get index of value in the df, first occurance
-                            index = values.index(unique_val)
-
-                            # get the row in the df with the data
-                            row = df.iloc[index]
+                        # get the rows with the first occurance of each
+                        # unique value, in the same order as unique
+                        first_rows = df.drop_duplicates(subset=parameter)
 
+                        # iterate over the rows of the unique values
+                        for _, row in first_rows.iterrows():
                             # add info to dict
                             # note that the unique value is retrieved from
                             # the df and not from the list with unique
@@ -1604,10 +1605,10 @@ class Configurations:
 
                             # compute average cost and add to dict
                             #concept excluded so cost row.concept != None replaced by row.material_cost
-                            if type_ == 'Material' and row.material_cost != None:
+                            if type_ == 'Material' and row.material_cost is not None:
                                 lines[parameter][cost_var].append(
                                     np.mean(list(row.material_cost.values())))
-                            if type_ == 'CO2' and row.CO2_cost != None:
+                            if type_ == 'CO2' and row.CO2_cost is not None:
                                 lines[parameter][cost_var].append(
                                     np.mean(list(row.CO2_cost.values())))
 
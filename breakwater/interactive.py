@@ -147,7 +147,7 @@ def interactive_design(
 
     # delete python input from parameters as these are given in Python
     for parameter in python_input.keys():
-        if parameter in vkwargs.keys():
+        if parameter in vkwargs:
             del vkwargs[parameter]
 
     # process the cost
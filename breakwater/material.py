@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from tabulate import tabulate
 from pandas import read_excel, read_csv
 
@@ -304,11 +303,11 @@ class RockGrading:
         else:
             raise KeyError('Give Material or CO2 as input for the argument "type"')
 
-        rock_classes = list(self.grading.keys())
+        rock_classes = list(self.grading)
         # iterate over the prices in the given dict
         for class_, price in cost.items():
             # check if the rock class is in the grading
-            if class_ in self.grading.keys():
+            if class_ in self.grading:
                 # class is in the grading so add price to the nested dict
                 self.grading[class_][dictvar] = price
 
@@ -354,8 +353,8 @@ class RockGrading:
                 rock_class = class_
                 break
 
-        if rock_class == None:
-            max_class = list(self.grading.keys())[-1]
+        if rock_class is None:
+            max_class = list(self.grading)[-1]
             max_mass = self.grading[max_class]['M50'][1]
             max_dn = np.round((max_mass/2650)**(1/3), 3)
             raise RockGradingError(
@@ -450,6 +449,8 @@ class RockGrading:
         KeyError
             If the specified rock class is not in the rock grading
         """
+        import matplotlib.pyplot as plt
+
         y = np.linspace(0, 0.999999, 1000)
         My = self.rosin_rammler(class_=class_, y=y)
 
@@ -572,8 +573,8 @@ class ConcreteArmour:
                 class_volume = volume
                 break
 
-        if class_volume == None:
-            max_class = list(self.units.keys())[-1]
+        if class_volume is None:
+            max_class = list(self.units)[-1]
             max_dn = np.round(max_class**(1/3), 3)
             msg = ('given dn is out of range for the specified armour units'
                    f', {max_dn} m (V = {max_class} m^3) is the maximum '
@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 import numpy as np
 from tabulate import tabulate
 
@@ -166,6 +165,9 @@ class RubbleMound:
         self.bishop = None
         self.F_norm = None
 
+        # set attribute to cache the area of the layers of each variant
+        self._areas = {}
+
         # set input as private attribute
         self._input_arguments = {
             "structure_type": structure_type,
@@ -360,7 +362,7 @@ class RubbleMound:
             pass
         else:
             # get armour_layer
-            if armour_layer is "Rock":
+            if armour_layer == "Rock":
                 material = "armourstones"
             else:
                 material = "units"
@@ -642,7 +644,7 @@ class RubbleMound:
 
         # check structure type: breakwater or revetment.
         # breakwater is covered with armour on both sides
-        if self._input_arguments["structure_type"] is "breakwater":
+        if self._input_arguments["structure_type"] == "breakwater":
             # compute armour layer
             armour_y1 = t_filter + t_underlayer + t_scour
             armour_y2 = height
@@ -686,7 +688,7 @@ class RubbleMound:
 
             # check if armour layer is made out of rock
             # as there is a different toe structure for rock and armour units
-            if self._input_arguments["armour"] is "Rock":
+            if self._input_arguments["armour"] == "Rock":
                 # compute point where armour layer intersect with the toe
                 x = (abs(arm_under_x2 - armour_x1) * V_toe / H_toe) / (
                     V / H + V_toe / H_toe
@@ -867,7 +869,7 @@ class RubbleMound:
 
         # check structure type: breakwater or revetment. default is breakwater
         # revetment is covered with armour only on sea side
-        if self._input_arguments["structure_type"] is "revetment":
+        if self._input_arguments["structure_type"] == "revetment":
             # compute armour layer
             armour_y1 = t_filter + t_underlayer + t_scour
             armour_y2 = height
@@ -911,7 +913,7 @@ class RubbleMound:
 
             # check if armour layer is made out of rock
             # as there is a different toe structure for rock and armour units
-            if self._input_arguments["armour"] is "Rock":
+            if self._input_arguments["armour"] == "Rock":
                 # compute point where armour layer intersect with the toe
                 x = (abs(arm_under_x2 - armour_x1) * V_toe / H_toe) / (
                     V / H + V_toe / H_toe
@@ -1145,13 +1147,16 @@ class RubbleMound:
         else:
             raise KeyError('Give Material or CO2 as input for the argument "type"')
 
-        if dictvar in Grading[list(Grading.grading.keys())[0]]:
+        if dictvar in Grading[next(iter(Grading.grading))]:
             # pricing has been added
             pass
         else:
             # pricing has not been added, raise error
             raise RockGradingError("There is no pricing in the RockGrading")
 
+        # the type of armour is the same for all variants
+        concrete_armour = self._input_arguments["armour"] != "Rock"
+
         # set empty dict to store the output in
         cost = {}
 
@@ -1164,15 +1169,13 @@ class RubbleMound:
             # iterate over the layers to price each layer
             variant_price = {}
             for layer, area in areas.items():
-                if layer is "core":
+                if layer == "core":
                     # core is not included in the structure dict
                     price = (core_price + transport_cost) * self._input_arguments[
                         "Dn50_core"
                     ]
 
-                elif (
-                    self._input_arguments["armour"] is not "Rock" and layer is "armour"
-                ):
+                elif concrete_armour and layer == "armour":
                     # concrete armour units
                     price = area * unit_price
 
@@ -1187,10 +1190,10 @@ class RubbleMound:
                 variant_price[layer] = np.round(price, 2)
 
             # add to cost dict
-            if output is "variant" or output is "average":
+            if output == "variant" or output == "average":
                 # add total cost of all layers
                 cost[id] = np.round(np.sum(list(variant_price.values())), 2)
-            elif output is "layer":
+            elif output == "layer":
                 # add the cost of each layer
                 cost[id] = variant_price
             else:
@@ -1203,7 +1206,7 @@ class RubbleMound:
                 )
 
         # check if average must be computed
-        if output is "average":
+        if output == "average":
             # compute average cost
             cost = {"average": np.round(np.average(list(cost.values())), 2)}
 
@@ -1335,6 +1338,8 @@ class RubbleMound:
         KeyError
             If there is no variant with the given identifier
         """
+        import matplotlib.pyplot as plt
+
         # validate variants
         variants = self._validate_variant(variants)
 
@@ -1545,6 +1550,16 @@ class RubbleMound:
         dict
             dict with the area of each layer
         """
+        # the geometry of a variant is fixed once it has been designed,
+        # so the areas are computed once and reused, for instance when
+        # both the material and the CO2 cost are computed
+        computed = getattr(self, "_areas", None)
+        if computed is None:
+            # concept was saved before the areas were cached
+            computed = self._areas = {}
+        if variantID in computed:
+            return dict(computed[variantID])
+
         # get the coordinates of the layers
         coordinates = self._layers(variantID)
 
@@ -1561,7 +1576,9 @@ class RubbleMound:
             # add to area dict
             area[layer] = A
 
-        return area
+        computed[variantID] = area
+
+        return dict(area)
 
 
 class RockRubbleMound(RubbleMound):
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 from .exceptions import InputError, RockGradingError
 
@@ -29,13 +28,13 @@ def _process_cost(structure, type, cost, Grading, validate=True):
     elif type == 'CO2':
         dictvar = 'co2_price'
 
-    if dictvar == None:
+    if dictvar is None:
         raise KeyError('Give Material or CO2 as input for the argument "type"')
 
     if cost is not None:
         # cost have been added
         # check if cost have been added to the grading
-        if dictvar in Grading[list(Grading.grading.keys())[0]]:
+        if dictvar in Grading[next(iter(Grading.grading))]:
             # pricing has been added
             pass
         else:
@@ -45,24 +44,24 @@ def _process_cost(structure, type, cost, Grading, validate=True):
         # check structure to check structure specific cost
         if 'RRM' in structure:
             # check if core_price is in cost
-            if 'core_price' not in cost.keys() or cost['core_price'] is None:
+            if 'core_price' not in cost or cost['core_price'] is None:
                 raise KeyError(
                     'core_price must be specified when computing the cost of RRM')
 
         if 'CRM' in structure or 'CC' in structure:
             # check if unit_price is in cost
-            if 'unit_price' not in cost.keys() or cost['unit_price'] is None:
+            if 'unit_price' not in cost or cost['unit_price'] is None:
                 raise KeyError(
                     'unit_price must be specified when computing the cost of CRM/CC')
 
         if 'RC' in structure or 'CC' in structure:
             # check if fill_price is in cost
-            if 'fill_price' not in cost.keys() or cost['fill_price'] is None:
+            if 'fill_price' not in cost or cost['fill_price'] is None:
                 raise KeyError(
                     'fill_price must be specified when computing the cost of CRM/CC')
 
             # check if concrete_price is in cost
-            if 'concrete_price' not in cost.keys() or cost['concrete_price'] is None:
+            if 'concrete_price' not in cost or cost['concrete_price'] is None:
                 raise KeyError(
                     'concrete_price must be specified when computing the cost of CRM/CC')
 
@@ -94,9 +93,11 @@ def cost_influence(type, lines):
         dictionary with the parameters as keys and a nested dict with
         the values and cost
     """
+    import matplotlib.pyplot as plt
+
     # check if more than one parameter has been given
 
-    if len(lines.keys()) > 1:
+    if len(lines) > 1:
         # values must be normalised
         normalise = True
 
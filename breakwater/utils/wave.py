@@ -1,4 +1,5 @@
 import numpy as np
+from functools import lru_cache
 from scipy.optimize import fsolve
 
 def shoaling_coefficient(h, T, H0, linear=False):
@@ -52,7 +53,9 @@ def shoaling_coefficient(h, T, H0, linear=False):
 def dispersion(T, h):
     """ Dispersion relationship
 
-    uses fsolve to find the wave length
+    uses fsolve to find the wave length, the solution is cached for
+    each combination of T and h as the same wave length is required
+    for every concept designed with the same LimitState
 
     Parameters
     ----------
@@ -65,6 +68,12 @@ def dispersion(T, h):
     L : float
         the wave length [m]
     """
+    return _dispersion(float(T), float(h))
+
+
+@lru_cache(maxsize=1024)
+def _dispersion(T, h):
+    """ Solve the dispersion relationship, see :py:func:`dispersion` """
     g = 9.81
 
     # deep water wave length
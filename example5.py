@@ -5,20 +5,27 @@ from Cubipod import Cubipod
 How to use the C02 Footprint functions for the Revetment at Energy Island
     Hydraulic conditions still need to be updated -> as well the gradings will probably be (Cupipod)
 """
-Hm0_315, Tp_315, Tm_315 = 14.2, 17.6, 13.5  # 1/10.000 yrs from 315 degrees North
-Hm0_270, Tp_270, Tm_270 = 13.9, 16.4, 12.3  # 1/10.000 yrs from 270 degrees North
-Hm0_225, Tp_225, Tm_225 = 12.7, 14.4, 11.1  # 1/10.000 yrs from 225 degrees North
+# 1/10.000 yrs wave conditions (Hm0, Tp, Tm) per direction in degrees North
+WAVE_CONDITIONS = {
+    "315": (14.2, 17.6, 13.5),
+    "270": (13.9, 16.4, 12.3),
+    "225": (12.7, 14.4, 11.1),
+}
+
+# select the normative wave direction
+direction = "225"
+Hm0, Tp, Tm = WAVE_CONDITIONS[direction]
 
-battjes = bw.BattjesGroenendijk(Hm0=Hm0_225, h=27.71, slope_foreshore=(1, 100))
+battjes = bw.BattjesGroenendijk(Hm0=Hm0, h=27.71, slope_foreshore=(1, 100))
 H2_per = battjes.get_Hp(0.02)
 
 # define a limit state with hydraulic parameters, and the allowed damage
 ULS = bw.LimitState(
     h=27.71,
-    Hm0=Hm0_225,
+    Hm0=Hm0,
     H2_per=H2_per,
-    Tp=Tp_225,
-    Tm=Tm_225,
+    Tp=Tp,
+    Tm=Tm,
     T_m_min_1=15,
     Sd=5,
     Nod=4,
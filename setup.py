@@ -42,7 +42,7 @@ setuptools.setup(
         "Operating System :: OS Independent",
         "License :: Free for non-commercial use",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     install_requires=requires,
     keywords="conceptual design hydraulic engineering breakwaters",
     include_package_data=True,
@@ -1,5 +1,6 @@
 import context
 import unittest
+from unittest import mock
 import warnings
 import numpy as np
 
@@ -67,6 +68,21 @@ class TestCaisson(unittest.TestCase):
             rho_w=1000, hb=4, B=18.895, m=991289)
         self.assertAlmostEqual(B_eff, 22.309, 3)
 
+    def test_area_repeated(self):
+        # the layers are only computed for the first call
+        self.bw._areas.clear()
+        with mock.patch.object(
+                self.bw, '_layers', wraps=self.bw._layers) as layers:
+            areas = self.bw.area('a')
+            repeated = self.bw.area('a')
+        layers.assert_called_once_with('a')
+
+        # repeated calls return equal but independent dicts
+        self.assertDictEqual(areas, repeated)
+        self.assertIsNot(areas, repeated)
+        areas['caisson'] = 0
+        self.assertNotEqual(self.bw.area('a')['caisson'], 0)
+
 
 if __name__ == '__main__':
     unittest.main()
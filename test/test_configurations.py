@@ -2,6 +2,7 @@ import context
 import unittest
 import warnings
 import numpy as np
+from unittest import mock
 
 from breakwater.design import Configurations
 from breakwater.conditions import LimitState
@@ -178,6 +179,46 @@ class TestConfigurations(unittest.TestCase):
         self.assertListEqual(types, specified)
 
 
+class TestCostInfluence(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        ULS = LimitState(
+            h=15, Nod=0.5, Sd=2, Ho=5, q=10, Hm0=3.22, T_m_min_1=8.66,
+            label='ULS', Hmax=6)
+
+        with warnings.catch_warnings(record=True) as w:
+            ULS.transform_periods(0.5)
+            ULS.check_deep_water()
+
+        NEN = RockGrading()
+        NEN.add_cost(
+            type='Material',
+            cost={class_: 100 + 10*i for i, class_ in enumerate(NEN.grading)})
+
+        # only the slope and the width of the crest vary
+        cls.configs = Configurations(
+            structure=['RRM'], LimitState=ULS, slope=((1,3), (2,3), 3),
+            slope_foreshore=(1,100), rho_w=1000, B=(3,8,2), N=3000, P=0.4,
+            Grading=NEN, Dn50_core=0.2, safety=1, slope_toe=(2,3))
+        cls.configs.add_cost(type='Material', core_price=20)
+
+    def test_cost_influence(self):
+        # get the lines that are passed to the plot function
+        with mock.patch('breakwater.design.cost_influence') as plot:
+            self.configs.cost_influence('Material')
+        lines = plot.call_args[1]['lines']
+
+        # only the varying parameters are plotted
+        self.assertListEqual(sorted(lines), ['B', 'slope'])
+
+        # slopes are converted to degrees, with one cost per value
+        slopes = [convert(slope) for slope in ((1,3), (1.5,3), (2,3))]
+        np.testing.assert_almost_equal(lines['slope']['values'], slopes)
+        self.assertEqual(len(lines['slope']['material_cost']), 3)
+        self.assertEqual(len(lines['B']['values']), 2)
+
+
 def convert(slope):
     if (isinstance(slope, tuple) or isinstance(slope, list)
             or isinstance(slope, np.void)):
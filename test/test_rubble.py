@@ -1,5 +1,6 @@
 import context
 import unittest
+from unittest import mock
 import numpy as np
 
 from breakwater.rubble import RockRubbleMound, ConcreteRubbleMound
@@ -70,6 +71,21 @@ class TestRockRubbleMound(unittest.TestCase):
         for i, (layer, area) in enumerate(areas.items()):
             self.assertAlmostEqual(area, computed[i], 3)
 
+    def test_area_repeated(self):
+        # the layers are only computed for the first call
+        self.bw._areas.clear()
+        with mock.patch.object(
+                self.bw, '_layers', wraps=self.bw._layers) as layers:
+            areas = self.bw.area('a')
+            repeated = self.bw.area('a')
+        layers.assert_called_once_with('a')
+
+        # repeated calls return equal but independent dicts
+        self.assertDictEqual(areas, repeated)
+        self.assertIsNot(areas, repeated)
+        areas['armour'] = 0
+        self.assertNotEqual(self.bw.area('a')['armour'], 0)
+
 
 class TestConcreteRubbleMound(unittest.TestCase):
 
@@ -16,6 +16,18 @@ class TestRock(unittest.TestCase):
         xi_cr_deep = stability.xi_critical(
             Cpl=6.2, Cs=1, P=0.4, alpha=self.slope)
         self.assertAlmostEqual(xi_cr_deep, 3.0, 1)
+        # closed form is evaluated elementwise for arrays of samples
+        Cpl = np.array([6.2, 5.8, 8.4])
+        Cs = np.array([1, 0.92, 1.3])
+        P = np.array([0.4, 0.1, 0.6])
+        alpha = np.array([self.slope, np.arctan(1/2), np.arctan(1/4)])
+        xi_cr = stability.xi_critical(Cpl=Cpl, Cs=Cs, P=P, alpha=alpha)
+        for i in range(len(Cpl)):
+            xi_cr_scalar = stability.xi_critical(
+                Cpl=Cpl[i], Cs=Cs[i], P=P[i], alpha=alpha[i])
+            self.assertAlmostEqual(xi_cr[i], xi_cr_scalar, 12)
+        # the elements differ, so a broadcast or reduction is detected
+        self.assertEqual(len(np.unique(xi_cr)), len(Cpl))
 
     def test_vandermeer_deep(self):
         # plunging conditons, Rock Manual (2007) Box 5.13
@@ -34,6 +46,22 @@ class TestRock(unittest.TestCase):
             alpha=np.arctan(1/1.5),safety=0)
         self.assertAlmostEqual(Dn50, 1.5519, 4)
 
+    def test_vandermeer_deep_array(self):
+        # plunging and surging conditions evaluated in one call
+        Hs = np.array([5, 4, 5])
+        xi_m = np.array([1.85, 4.46, 4.46])
+        alpha = np.array([self.slope, np.arctan(1/1.5), self.slope])
+        Dn50 = stability.vandermeer_deep(
+            Hs=Hs, Delta=1.6, P=0.4, Sd=5, N=2100, xi_m=xi_m, alpha=alpha,
+            safety=0)
+        np.testing.assert_almost_equal(Dn50[:2], [1.26, 1.5519], 2)
+        # each element must equal the scalar computation
+        for i in range(len(Hs)):
+            Dn50_scalar = stability.vandermeer_deep(
+                Hs=Hs[i], Delta=1.6, P=0.4, Sd=5, N=2100, xi_m=xi_m[i],
+                alpha=alpha[i], safety=0)
+            self.assertAlmostEqual(Dn50[i], Dn50_scalar, 12)
+
     def test_vandermeer_shallow(self):
         # plunging conditions, Rock Manual (2007) Box 5.15 (with errata)
         Dn50 = stability.vandermeer_shallow(
@@ -46,6 +74,24 @@ class TestRock(unittest.TestCase):
             alpha=np.arctan(1/2), safety=0)
         self.assertAlmostEqual(Dn50, 1.3713, 4)
 
+    def test_vandermeer_shallow_array(self):
+        # plunging and surging conditions evaluated in one call
+        Hs = np.array([4, 3.5, 4])
+        H2 = np.array([4.95, 4.2, 4.95])
+        Delta = np.array([1.6, 1.6, 1.5])
+        xi = np.array([2.39, 4.01, 2.0])
+        alpha = np.array([self.slope, np.arctan(1/2), self.slope])
+        Dn50 = stability.vandermeer_shallow(
+            Hs=Hs, H2=H2, Delta=Delta, P=0.4, Sd=2, N=2273, xi_s_min_1=xi,
+            alpha=alpha, safety=0)
+        np.testing.assert_almost_equal(Dn50[:2], [1.27, 1.3713], 2)
+        # each element must equal the scalar computation
+        for i in range(len(Hs)):
+            Dn50_scalar = stability.vandermeer_shallow(
+                Hs=Hs[i], H2=H2[i], Delta=Delta[i], P=0.4, Sd=2, N=2273,
+                xi_s_min_1=xi[i], alpha=alpha[i], safety=0)
+            self.assertAlmostEqual(Dn50[i], Dn50_scalar, 12)
+
     def test_hudson(self):
         # Checked with values from Xbloc guidelines, table 1
         Dn = stability.hudson(H=5.01, Kd=16, Delta=1.33, alpha=np.arctan(3/4))